@@ -0,0 +1,20 @@
+from geopandas import GeoSeries
+from shapely.geometry import Point
+
+
+class BenchIndexing:
+
+    param_names = ['n']
+    params = [1000, 10000, 100000]
+
+    def setup(self, n):
+        self.s = GeoSeries([Point(i, i) for i in range(n)])
+
+    def time_getitem_scalar(self, n):
+        self.s[5]
+
+    def time_getitem_slice(self, n):
+        self.s[:10]
+
+    def time_take(self, n):
+        self.s.take([0, 1, 2])
@@ -107,6 +107,9 @@ class GeoPandasBase(object):
         time it's requested.
 
         """
+        if not self._sindex_generated:
+            # nothing to invalidate, avoid the (pandas) attribute setting
+            return
         self._sindex = None
         self._sindex_generated = False
 
@@ -2,11 +2,20 @@ from distutils.version import LooseVersion
 from functools import partial
 import json
 
+try:
+    from functools import lru_cache
+except ImportError:
+    # Python 2 (the cached transformers are only used with pyproj >= 3.1,
+    # which requires Python 3)
+    def lru_cache(maxsize=None):
+        return lambda func: func
+
 import numpy as np
 import pandas as pd
 from pandas import Series
 import pyproj
-from shapely.geometry import shape, Point
+import shapely
+from shapely.geometry import shape, Point, GeometryCollection
 from shapely.geometry.base import BaseGeometry
 from shapely.ops import transform
 
@@ -16,17 +25,136 @@ from geopandas.base import (
 
 
 _PYPROJ2 = LooseVersion(pyproj.__version__) >= LooseVersion('2.1.0')
+_PYPROJ31 = LooseVersion(pyproj.__version__) >= LooseVersion('3.1.0')
+_SHAPELY2 = LooseVersion(shapely.__version__) >= LooseVersion('2.0')
+
+# default fill value for missing geometries (geometries are immutable, so a
+# single instance can be shared). With shapely 2, BaseGeometry() is deprecated
+# and returns an empty GeometryCollection.
+if _SHAPELY2:
+    _EMPTY_GEOM = GeometryCollection()
+else:
+    _EMPTY_GEOM = BaseGeometry()
+
+
+@lru_cache(maxsize=128)
+def _get_transformer(crs_from, crs_to):
+    """
+    Return a (cached) pyproj Transformer between two pyproj CRS objects.
+
+    Creating a Transformer is expensive compared to transforming a small
+    number of coordinates, so they are reused across ``to_crs`` calls.
+    Only used with pyproj >= 3.1, where Transformers are thread-safe and
+    can be shared.
+    """
+    return pyproj.Transformer.from_crs(crs_from, crs_to, always_xy=True)
 
 
-def _is_empty(x):
-    try:
-        return x.is_empty
-    except:
+def _transform_coordinates(project, data):
+    """
+    Apply ``project`` to the coordinates of all geometries at once.
+
+    The coordinates are extracted into flat arrays, transformed with a single
+    call and put back into copies of the geometries (requires shapely >= 2).
+    2D and 3D geometries are handled separately to not pass NaN z values
+    to ``project``.
+    """
+    geoms = np.array(data, dtype=object)
+    geoms[pd.isna(geoms)] = None
+    has_z = shapely.has_z(geoms)
+    for mask, include_z in ((~has_z, False), (has_z, True)):
+        if not mask.any():
+            continue
+        subset = geoms[mask]
+        coords = shapely.get_coordinates(subset, include_z=include_z)
+        if len(coords):
+            coords = np.column_stack(project(*coords.T))
+            geoms[mask] = shapely.set_coordinates(subset, coords)
+    return geoms
+
+
+def _can_use_to_geojson(data):
+    """
+    Whether ``shapely.to_geojson`` can be used to write the geometries.
+
+    Requires shapely >= 2 built against GEOS >= 3.10 (which added the GeoJSON
+    writer). LinearRings are written as null by to_geojson, so they are not
+    supported. With GEOS < 3.12, to_geojson drops the z coordinates, so it
+    can then only be used if all geometries are 2D.
+    """
+    if not _SHAPELY2 or shapely.geos_version < (3, 10, 0):
         return False
+    geoms = np.array(data, dtype=object)
+    geoms[pd.isna(geoms)] = None
+    if (shapely.get_type_id(geoms) == 2).any():
+        return False
+    if shapely.geos_version >= (3, 12, 0):
+        return True
+    return not shapely.has_z(geoms).any()
+
+
+def _to_geojson(data):
+    """
+    Convert an array of geometries to an array of GeoJSON strings and an
+    (N, 4) array of their bounds, using vectorized shapely 2 functions.
+
+    Missing and empty geometries are returned as None with NaN bounds, as
+    they are represented as null geometries in a FeatureCollection.
+    """
+    geoms = np.array(data, dtype=object)
+    geoms[pd.isna(geoms)] = None
+    geoms[shapely.is_empty(geoms)] = None
+    return shapely.to_geojson(geoms), shapely.bounds(geoms)
+
+
+def _coords_to_tuples(coords):
+    """
+    Recursively convert nested coordinate lists to tuples.
+    """
+    if coords and isinstance(coords[0], list):
+        return tuple(_coords_to_tuples(c) for c in coords)
+    return tuple(coords)
+
+
+def _geojson_to_mapping(geom):
+    """
+    Convert a parsed GeoJSON geometry dict to the form returned by shapely's
+    ``mapping``, i.e. with coordinates as (nested) tuples instead of lists.
+    """
+    if geom is None:
+        return None
+    if geom['type'] == 'GeometryCollection':
+        geom['geometries'] = [_geojson_to_mapping(g)
+                              for g in geom['geometries']]
+    elif geom['type'] == 'MultiPolygon':
+        # mapping returns the polygons of a MultiPolygon as a list
+        geom['coordinates'] = [_coords_to_tuples(c)
+                               for c in geom['coordinates']]
+    else:
+        geom['coordinates'] = _coords_to_tuples(geom['coordinates'])
+    return geom
+
+
+def _total_bounds(bounds):
+    """
+    Return the total bounds tuple of an (N, 4) bounds array with NaN rows
+    for missing geometries, or None if all geometries are missing.
+    """
+    bounds = bounds[~np.isnan(bounds[:, 0])]
+    if not len(bounds):
+        return None
+    return (bounds[:, 0].min(), bounds[:, 1].min(),
+            bounds[:, 2].max(), bounds[:, 3].max())
 
 
 def _validate_geometry_data(data):
-    if not all(isinstance(item, BaseGeometry) or pd.isna(item) for item in data):
+    if _SHAPELY2:
+        data = np.asarray(data, dtype=object)
+        valid = (shapely.is_valid_input(data) | pd.isna(data)).all()
+    else:
+        valid = all(isinstance(item, BaseGeometry) or pd.isna(item)
+                    for item in data)
+    if not valid:
         raise TypeError("Input geometry column must contain valid geometry objects.")
 
 
@@ -105,6 +233,20 @@ class GeoSeries(GeoPandasBase, Series):
         # (doesn't know crs, all work is already done above)
         pass
 
+    @classmethod
+    def _simple_new(cls, values, index=None, crs=None, name=None):
+        """
+        Create a GeoSeries from an array of geometries without validating
+        the data. Only for internal use, when ``values`` is known to only
+        contain geometries or missing values.
+        """
+        self = super(GeoSeries, cls).__new__(cls)
+        super(GeoSeries, self).__init__(values, index=index, name=name,
+                                        dtype=object)
+        self.crs = crs
+        self._invalidate_sindex()
+        return self
+
     def append(self, *args, **kwargs):
         return self._wrapped_pandas_method('append', *args, **kwargs)
 
@@ -115,13 +257,45 @@ class GeoSeries(GeoPandasBase, Series):
     @property
     def x(self):
         """Return the x location of point geometries in a GeoSeries"""
+        coords = self._point_coords()
+        if coords is not None:
+            return Series(coords[0], index=self.index)
         return _delegate_property('x', self)
 
     @property
     def y(self):
         """Return the y location of point geometries in a GeoSeries"""
+        coords = self._point_coords()
+        if coords is not None:
+            return Series(coords[1], index=self.index)
         return _delegate_property('y', self)
 
+    def _point_coords(self):
+        """
+        Return the coordinates of a Point-only GeoSeries as separate,
+        contiguous float64 ``(x, y, z)`` arrays (``z`` is None if all points
+        are 2D).
+
+        Returns None if the GeoSeries contains other geometry types, missing
+        or empty geometries, or if shapely < 2 is installed. The coordinates
+        are extracted on demand and not stored on the GeoSeries, as its values
+        can be modified in place.
+        """
+        if not _SHAPELY2:
+            return None
+        values = self.values
+        if pd.isna(values).any():
+            return None
+        if ((shapely.get_type_id(values) != 0).any()
+                or shapely.is_empty(values).any()):
+            return None
+        include_z = bool(shapely.has_z(values).any())
+        coords = shapely.get_coordinates(values, include_z=include_z)
+        coords = np.ascontiguousarray(coords.T)
+        if include_z:
+            return coords[0], coords[1], coords[2]
+        return coords[0], coords[1], None
+
     @classmethod
     def from_file(cls, filename, **kwargs):
         """Alternate constructor to create a ``GeoSeries`` from a file.
@@ -141,10 +315,10 @@ class GeoSeries(GeoPandasBase, Series):
             etc.
         """
 
-        from geopandas import GeoDataFrame
-        df = GeoDataFrame.from_file(filename, **kwargs)
+        from geopandas.io.file import _read_geometries
+        geoms, crs = _read_geometries(filename, **kwargs)
 
-        return GeoSeries(df.geometry, crs=df.crs)
+        return GeoSeries._simple_new(geoms, crs=crs, name='geometry')
 
     @property
     def __geo_interface__(self):
@@ -155,16 +329,31 @@ class GeoSeries(GeoPandasBase, Series):
         Note that the features will have an empty ``properties`` dict as they
         don't have associated attributes (geometry only).
         """
-        from geopandas import GeoDataFrame
-        return GeoDataFrame({'geometry': self}).__geo_interface__
+        if not _can_use_to_geojson(self.values):
+            from geopandas import GeoDataFrame
+            return GeoDataFrame({'geometry': self}).__geo_interface__
+
+        # parse the GeoJSON strings of all geometries at once, instead of
+        # recursively building the geometry dicts with shapely's mapping
+        geometries, bounds = _to_geojson(self.values)
+        geometries = json.loads('[%s]' % ', '.join(
+            geom if geom is not None else 'null' for geom in geometries))
+        features = []
+        for fid, geom, bbox in zip(self.index, geometries, bounds.tolist()):
+            if geom is None:
+                bbox = None
+            features.append({'id': str(fid),
+                             'type': 'Feature',
+                             'properties': {},
+                             'geometry': _geojson_to_mapping(geom),
+                             'bbox': tuple(bbox) if bbox else None})
+        return {'type': 'FeatureCollection',
+                'features': features,
+                'bbox': _total_bounds(bounds)}
 
     def to_file(self, filename, driver="ESRI Shapefile", **kwargs):
-        from geopandas import GeoDataFrame
-        data = GeoDataFrame({"geometry": self,
-                             "id": self.index.values},
-                            index=self.index)
-        data.crs = self.crs
-        data.to_file(filename, driver, **kwargs)
+        from geopandas.io.file import _series_to_file
+        _series_to_file(self, filename, driver, **kwargs)
 
     #
     # Implement pandas methods
@@ -176,16 +365,35 @@ class GeoSeries(GeoPandasBase, Series):
 
     def _wrapped_pandas_method(self, mtd, *args, **kwargs):
         """Wrap a generic pandas method to ensure it returns a GeoSeries"""
-        val = getattr(super(GeoSeries, self), mtd)(*args, **kwargs)
+        if kwargs.get('inplace', False):
+            val = getattr(super(GeoSeries, self), mtd)(*args, **kwargs)
+        else:
+            # call the method on a plain Series holding the same data, so
+            # pandas does not construct (and validate) an intermediate
+            # GeoSeries through ``_constructor`` (passing the dtype avoids
+            # an O(n) dtype inference)
+            series = Series(self.values, index=self.index, name=self.name,
+                            dtype=object)
+            val = getattr(series, mtd)(*args, **kwargs)
         if type(val) == Series:
-            val.__class__ = GeoSeries
-            val.crs = self.crs
-            val._invalidate_sindex()
+            val = GeoSeries._simple_new(val.values, index=val.index,
+                                        crs=self.crs, name=val.name)
         return val
 
     def __getitem__(self, key):
         return self._wrapped_pandas_method('__getitem__', key)
 
+    def __setitem__(self, key, value):
+        super(GeoSeries, self).__setitem__(key, value)
+        self._invalidate_sindex()
+
+    def _maybe_update_cacher(self, *args, **kwargs):
+        # called by pandas after values are set in place (e.g. through
+        # .loc / .iloc assignment or fillna(inplace=True)), after which
+        # the spatial index no longer matches the geometries
+        self._invalidate_sindex()
+        return super(GeoSeries, self)._maybe_update_cacher(*args, **kwargs)
+
     def sort_index(self, *args, **kwargs):
         return self._wrapped_pandas_method('sort_index', *args, **kwargs)
 
@@ -206,7 +414,7 @@ class GeoSeries(GeoPandasBase, Series):
             object.__setattr__(self, name, getattr(other, name, None))
         return self
 
-    def copy(self, order='C'):
+    def copy(self, deep=True):
         """
         Make a copy of this GeoSeries object
 
@@ -219,9 +427,23 @@ class GeoSeries(GeoPandasBase, Series):
         -------
         copy : GeoSeries
         """
-        # FIXME: this will likely be unnecessary in pandas >= 0.13
-        return GeoSeries(self.values.copy(order), index=self.index,
-                      name=self.name).__finalize__(self)
+        return self._wrapped_pandas_method('copy', deep=deep)
+
+    def _compute_na_mask(self):
+        """
+        Return a boolean ndarray that is True where the value is missing
+        (None or NaN) or an empty geometry.
+        """
+        values = self.values
+        non_geo_null = pd.isna(values)
+        # only check the non-missing values for emptiness
+        valid = ~non_geo_null
+        val = np.zeros(len(values), dtype=bool)
+        if _SHAPELY2:
+            val[valid] = shapely.is_empty(values[valid])
+        else:
+            val[valid] = [geom.is_empty for geom in values[valid]]
+        return np.logical_or(non_geo_null, val, out=non_geo_null)
 
     def isna(self):
         """
@@ -238,9 +460,8 @@ class GeoSeries(GeoPandasBase, Series):
         --------
         GeoSereies.notna : inverse of isna
         """
-        non_geo_null = super(GeoSeries, self).isnull()
-        val = self.apply(_is_empty)
-        return Series(np.logical_or(non_geo_null, val))
+        return Series(self._compute_na_mask(), index=self.index,
+                      name=self.name)
 
     def isnull(self):
         """Alias for `isna` method. See `isna` for more detail."""
@@ -261,7 +482,9 @@ class GeoSeries(GeoPandasBase, Series):
         --------
         GeoSeries.isna : inverse of notna
         """
-        return ~self.isna()
+        mask = self._compute_na_mask()
+        return Series(np.logical_not(mask, out=mask), index=self.index,
+                      name=self.name)
 
     def notnull(self):
         """Alias for `notna` method. See `notna` for more detail."""
@@ -274,14 +497,22 @@ class GeoSeries(GeoPandasBase, Series):
         "method" is currently not implemented for pandas <= 0.12.
         """
         if value is None:
-            value = BaseGeometry()
+            value = _EMPTY_GEOM
         return super(GeoSeries, self).fillna(value=value, method=method,
                                              inplace=inplace, **kwargs)
 
     def align(self, other, join='outer', level=None, copy=True,
               fill_value=None, **kwargs):
+        if (level is None and isinstance(other, Series)
+                and self.index.equals(other.index)
+                and not pd.isna(self.values).any()
+                and not pd.isna(other.values).any()):
+            # identical indexes and nothing to fill: no need to reindex
+            if copy:
+                return self.copy(), other.copy()
+            return self, other
         if fill_value is None:
-            fill_value = BaseGeometry()
+            fill_value = _EMPTY_GEOM
         left, right = super(GeoSeries, self).align(other, join=join,
                                                    level=level, copy=copy,
                                                    fill_value=fill_value,
@@ -296,6 +527,16 @@ class GeoSeries(GeoPandasBase, Series):
         Note: This is not the same as the geometric method "contains".
         """
         if isinstance(other, BaseGeometry):
+            if isinstance(other, Point) and not other.is_empty:
+                coords = self._point_coords()
+                if coords is not None:
+                    return np.any((coords[0] == other.x)
+                                  & (coords[1] == other.y))
+            if (self._sindex_generated and self._sindex is not None
+                    and not other.is_empty):
+                # only check the geometries with intersecting bounds
+                candidates = list(self._sindex.intersection(other.bounds))
+                return np.any(self.iloc[candidates].geom_equals(other))
             return np.any(self.geom_equals(other))
         else:
             return False
@@ -336,24 +577,48 @@ class GeoSeries(GeoPandasBase, Series):
         epsg : int
             EPSG code specifying output projection.
         """
-        from fiona.crs import from_epsg
         if self.crs is None:
             raise ValueError('Cannot transform naive geometries.  '
                              'Please set a crs on the object first.')
         if crs is None:
             try:
-                crs = from_epsg(epsg)
+                epsg = int(epsg)
             except TypeError:
                 raise TypeError('Must set either crs or epsg for output.')
-        proj_in = pyproj.Proj(self.crs, preserve_units=True)
-        proj_out = pyproj.Proj(crs, preserve_units=True)
-        if _PYPROJ2:
-            transformer = pyproj.Transformer.from_proj(proj_in, proj_out)
+            if epsg <= 0:
+                raise ValueError("EPSG codes are positive integers")
+            # same crs dict as returned by fiona.crs.from_epsg
+            crs = {'init': 'epsg:{}'.format(epsg), 'no_defs': True}
+        if _PYPROJ31:
+            transformer = _get_transformer(
+                pyproj.CRS.from_user_input(self.crs),
+                pyproj.CRS.from_user_input(crs))
             project = transformer.transform
         else:
-            project = partial(pyproj.transform, proj_in, proj_out)
-        result = self.apply(lambda geom: transform(project, geom))
-        result.__class__ = GeoSeries
+            proj_in = pyproj.Proj(self.crs, preserve_units=True)
+            proj_out = pyproj.Proj(crs, preserve_units=True)
+            if _PYPROJ2:
+                transformer = pyproj.Transformer.from_proj(proj_in, proj_out)
+                project = transformer.transform
+            else:
+                project = partial(pyproj.transform, proj_in, proj_out)
+        coords = self._point_coords() if len(self) else None
+        if coords is not None and (coords[2] is None
+                                   or not np.isnan(coords[2]).any()):
+            # Point-only GeoSeries (all 2D or all 3D): transform the
+            # coordinate arrays directly and create the points from them
+            if coords[2] is None:
+                coords = coords[:2]
+            result = GeoSeries._simple_new(
+                shapely.points(*project(*coords)),
+                index=self.index, name=self.name)
+        elif _SHAPELY2:
+            result = GeoSeries._simple_new(
+                _transform_coordinates(project, self.values),
+                index=self.index, name=self.name)
+        else:
+            result = self.apply(lambda geom: transform(project, geom))
+            result.__class__ = GeoSeries
         result.crs = crs
         result._invalidate_sindex()
         return result
@@ -366,7 +631,24 @@ class GeoSeries(GeoPandasBase, Series):
         ----------
         *kwargs* that will be passed to json.dumps().
         """
-        return json.dumps(self.__geo_interface__, **kwargs)
+        if kwargs or not _can_use_to_geojson(self.values):
+            return json.dumps(self.__geo_interface__, **kwargs)
+
+        # assemble the FeatureCollection directly from the GeoJSON strings of
+        # the geometries instead of serializing the __geo_interface__ dicts
+        geometries, bounds = _to_geojson(self.values)
+        features = []
+        for fid, geom, bbox in zip(self.index, geometries, bounds.tolist()):
+            if geom is None:
+                geom = bbox = 'null'
+            else:
+                bbox = json.dumps(bbox)
+            features.append(
+                '{"id": %s, "type": "Feature", "properties": {}, '
+                '"geometry": %s, "bbox": %s}' % (json.dumps(str(fid)), geom,
+                                                 bbox))
+        return ('{"type": "FeatureCollection", "features": [%s], "bbox": %s}'
+                % (', '.join(features), json.dumps(_total_bounds(bounds))))
 
     #
     # Implement standard operators for GeoSeries
@@ -1,8 +1,12 @@
+from collections import OrderedDict
+from contextlib import contextmanager
 import os
 from distutils.version import LooseVersion
 
 import fiona
 import numpy as np
+import pandas as pd
+from shapely.geometry import mapping, shape
 
 import six
 
@@ -65,6 +69,42 @@ def read_file(filename, bbox=None, **kwargs):
     -------
     geodataframe : GeoDataFrame
     """
+    with _open_file(filename, bbox=bbox, **kwargs) as (features, f_filt, crs):
+        columns = list(features.meta["schema"]["properties"]) + ["geometry"]
+        gdf = GeoDataFrame.from_features(f_filt, crs=crs, columns=columns)
+
+    return gdf
+
+
+def _read_geometries(filename, bbox=None, **kwargs):
+    """
+    Read only the geometries of a file or URL, without the properties.
+
+    See ``read_file`` for the description of the parameters.
+
+    Returns
+    -------
+    geometries : ndarray of shapely geometries (object dtype)
+    crs : dict
+    """
+    with _open_file(filename, bbox=bbox, **kwargs) as (_, f_filt, crs):
+        geoms = [shape(f['geometry']) if f['geometry'] else None
+                 for f in f_filt]
+
+    # ensure 1D output (shapely geometries can implement the array interface)
+    out = np.empty(len(geoms), dtype=object)
+    out[:] = geoms
+    return out, crs
+
+
+@contextmanager
+def _open_file(filename, bbox=None, **kwargs):
+    """
+    Open a file or URL with fiona.
+
+    Yields the fiona collection, the features filtered by ``bbox`` (or the
+    collection itself if no ``bbox`` is given) and the crs.
+    """
     if _is_url(filename):
         req = _urlopen(filename)
         path_or_bytes = req.read()
@@ -92,10 +132,7 @@ def read_file(filename, bbox=None, **kwargs):
             else:
                 f_filt = features
 
-            columns = list(features.meta["schema"]["properties"]) + ["geometry"]
-            gdf = GeoDataFrame.from_features(f_filt, crs=crs, columns=columns)
-
-    return gdf
+            yield features, f_filt, crs
 
 
 def to_file(df, filename, driver="ESRI Shapefile", schema=None,
@@ -131,29 +168,62 @@ def to_file(df, filename, driver="ESRI Shapefile", schema=None,
             colxn.writerecords(df.iterfeatures())
 
 
-def infer_schema(df):
-    try:
-        from collections import OrderedDict
-    except ImportError:
-        from ordereddict import OrderedDict
-
-    def convert_type(column, in_type):
-        if in_type == object:
-            return 'str'
-        if in_type.name.startswith('datetime64'):
-            # numpy datetime type regardless of frequency
-            return 'datetime'
-        out_type = type(np.zeros(1, in_type).item()).__name__
-        if out_type == 'long':
-            out_type = 'int'
-        if not _FIONA18 and out_type == 'bool':
-            raise ValueError('column "{}" is boolean type, '.format(column) +
-                             'which is unsupported in file writing with fiona '
-                             '< 1.8. Consider casting the column to int type.')
-        return out_type
+def _series_to_file(s, filename, driver="ESRI Shapefile", schema=None,
+                    **kwargs):
+    """
+    Write a GeoSeries to an OGR data source, with its index stored in an
+    'id' property.
+
+    The features are created directly from the geometries and index values,
+    without creating an intermediate GeoDataFrame. See ``to_file`` for the
+    description of the parameters.
+    """
+    if s.empty:
+        raise ValueError("Cannot write empty GeoSeries to file.")
+    if schema is None:
+        properties = OrderedDict([('id', _convert_type('id', s.index.dtype))])
+        schema = {'geometry': _geometry_types(s), 'properties': properties}
+
+    # convert to object to get python scalars
+    ids = np.array(s.index, copy=False)
+    values = np.array(s.index.astype(object))
+    values[pd.isnull(values)] = None
+
+    def iterfeatures():
+        for fid, value, geom in zip(ids, values, s.values):
+            if pd.isnull(geom) or geom.is_empty:
+                geom = None
+            yield {'id': str(fid),
+                   'type': 'Feature',
+                   'properties': {'id': value},
+                   'geometry': mapping(geom) if geom is not None else None}
 
+    filename = os.path.abspath(os.path.expanduser(filename))
+    with fiona_env():
+        with fiona.open(filename, 'w', driver=driver, crs=s.crs,
+                        schema=schema, **kwargs) as colxn:
+            colxn.writerecords(iterfeatures())
+
+
+def _convert_type(column, in_type):
+    if in_type == object:
+        return 'str'
+    if in_type.name.startswith('datetime64'):
+        # numpy datetime type regardless of frequency
+        return 'datetime'
+    out_type = type(np.zeros(1, in_type).item()).__name__
+    if out_type == 'long':
+        out_type = 'int'
+    if not _FIONA18 and out_type == 'bool':
+        raise ValueError('column "{}" is boolean type, '.format(column) +
+                         'which is unsupported in file writing with fiona '
+                         '< 1.8. Consider casting the column to int type.')
+    return out_type
+
+
+def infer_schema(df):
     properties = OrderedDict([
-        (col, convert_type(col, _type)) for col, _type in
+        (col, _convert_type(col, _type)) for col, _type in
         zip(df.columns, df.dtypes) if col != df._geometry_column_name
     ])
 
@@ -171,7 +241,8 @@ def infer_schema(df):
 
 def _geometry_types(df):
     """
-    Determine the geometry types in the GeoDataFrame for the schema.
+    Determine the geometry types in the GeoDataFrame (or GeoSeries) for the
+    schema.
     """
     if _FIONA18:
         # Starting from Fiona 1.8, schema submitted to fiona to write a gdf
@@ -91,3 +91,32 @@ def test_transform2(epsg4326, epsg26918):
     # the same CRS
     assert_geodataframe_equal(df, utm, check_less_precise=True,
                               check_crs=False)
+
+
+def test_to_crs_mixed_geometries():
+    from shapely.geometry import LineString, MultiPoint, Point, Polygon
+    from geopandas import GeoSeries
+
+    poly = Polygon([(0, 0), (10, 0), (10, 10), (0, 10)],
+                   [[(2, 2), (4, 2), (4, 4), (2, 4)]])
+    s = GeoSeries([poly, LineString([(0, 0), (5, 5)]),
+                   MultiPoint([(1, 1), (2, 2)]), Point(1, 2, 3)],
+                  crs={'init': 'epsg:26918', 'no_defs': True})
+    s = s.translate(500000, 4500000)
+    lonlat = s.to_crs(epsg=4326)
+    assert list(lonlat.geom_type) == list(s.geom_type)
+    assert list(lonlat.has_z) == list(s.has_z)
+    utm = lonlat.to_crs(epsg=26918)
+    assert all(utm.geom_almost_equals(s, decimal=3))
+
+
+def test_to_crs_points_3d():
+    from shapely.geometry import Point
+    from geopandas import GeoSeries
+
+    s = GeoSeries([Point(500000, 4500000, 10), Point(500010, 4500010, 20)],
+                  crs={'init': 'epsg:26918', 'no_defs': True})
+    lonlat = s.to_crs(epsg=4326)
+    assert lonlat.has_z.all()
+    utm = lonlat.to_crs(epsg=26918)
+    assert all(utm.geom_almost_equals(s, decimal=3))
@@ -8,11 +8,13 @@ import tempfile
 
 import numpy as np
 import pandas as pd
-from shapely.geometry import (Polygon, Point, LineString,
-                              MultiPoint, MultiLineString, MultiPolygon)
+from shapely.geometry import (Polygon, Point, LineString, LinearRing,
+                              MultiPoint, MultiLineString, MultiPolygon,
+                              mapping)
 from shapely.geometry.base import BaseGeometry
 
 from geopandas import GeoSeries
+from geopandas.geoseries import _SHAPELY2
 
 import pytest
 from geopandas.tests.util import geom_equals
@@ -54,6 +56,38 @@ class TestSeries:
         assert type(gc) is GeoSeries
         assert self.g3.name == gc.name
         assert self.g3.crs == gc.crs
+        assert not np.shares_memory(gc.values, self.g3.values)
+
+        gc = self.g3.copy(deep=False)
+        assert type(gc) is GeoSeries
+        assert self.g3.crs == gc.crs
+        assert np.shares_memory(gc.values, self.g3.values)
+
+    def test_wrapped_pandas_methods(self):
+        s = self.landmarks[[1, 0]]
+        assert type(s) is GeoSeries
+        assert s.crs == self.landmarks.crs
+        res = s.sort_index()
+        assert type(res) is GeoSeries
+        assert res.crs == self.landmarks.crs
+        assert geom_equals(res, self.landmarks)
+        s.sort_index(inplace=True)
+        assert type(s) is GeoSeries
+        assert geom_equals(s, self.landmarks)
+
+    def test_indexing_skips_validation(self, monkeypatch):
+        # selecting from an existing GeoSeries should not re-validate the
+        # geometries of the full series
+        s = GeoSeries([Point(i, i) for i in range(10)], index=range(9, -1, -1))
+
+        def fail(data):
+            raise AssertionError("geometry data should not be validated")
+
+        monkeypatch.setattr('geopandas.geoseries._validate_geometry_data',
+                            fail)
+        assert type(s[:5]) is GeoSeries
+        assert type(s.take([0, 1])) is GeoSeries
+        assert type(s.sort_index()) is GeoSeries
 
     def test_in(self):
         assert self.t1 in self.g1
@@ -63,6 +97,19 @@ class TestSeries:
         assert self.sq not in self.g3
         assert 5 not in self.g3
 
+    def test_in_points(self):
+        s = GeoSeries([Point(0, 1), Point(2, 3, 4)])
+        assert Point(0, 1) in s
+        assert Point(2, 3) in s
+        assert Point(1, 0) not in s
+        assert Point() not in s
+        assert self.t1 not in s
+
+    def test_xy_points_3d(self):
+        s = GeoSeries([Point(0, 1), Point(2, 3, 4)], index=['a', 'b'])
+        assert_series_equal(s.x, pd.Series([0., 2.], index=['a', 'b']))
+        assert_series_equal(s.y, pd.Series([1., 3.], index=['a', 'b']))
+
     def test_geom_equals(self):
         assert np.all(self.g1.geom_equals(self.g1))
         assert_array_equal(self.g1.geom_equals(self.sq), [False, True])
@@ -80,6 +127,24 @@ class TestSeries:
         assert a1['B'].equals(a2['B'])
         assert a1['C'].is_empty
 
+    def test_align_same_index(self):
+        res1, res2 = self.g3.align(self.g1)
+        assert isinstance(res1, GeoSeries)
+        assert isinstance(res2, GeoSeries)
+        assert res1 is not self.g3
+        assert res1.crs == self.g3.crs
+        assert geom_equals(res1, self.g3)
+        assert geom_equals(res2, self.g1)
+
+        res1, res2 = self.g3.align(self.g1, copy=False)
+        assert res1 is self.g3
+        assert res2 is self.g1
+
+        # missing values are still filled
+        res1, res2 = self.na_none.align(self.na_none)
+        assert res1[2].is_empty
+        assert res2[2].is_empty
+
     def test_align_crs(self):
         a1 = self.a1
         a1.crs = {'init': 'epsg:4326', 'no_defs': True}
@@ -129,6 +194,21 @@ class TestSeries:
         assert all(self.g3.geom_equals(s))
         # TODO: compare crs
 
+    def test_to_file_index(self):
+        from geopandas import GeoDataFrame
+        tempfilename = os.path.join(self.tempdir, 'test.shp')
+        s = self.g3.copy()
+        s.index = [5, 7]
+        s.to_file(tempfilename)
+        df = GeoDataFrame.from_file(tempfilename)
+        assert list(df['id']) == [5, 7]
+        assert all(self.g3.geom_equals(df.geometry))
+
+    def test_to_file_empty(self):
+        tempfilename = os.path.join(self.tempdir, 'test.shp')
+        with pytest.raises(ValueError, match="Cannot write empty"):
+            GeoSeries([]).to_file(tempfilename)
+
     def test_to_json(self):
         """
         Test whether GeoSeries.to_json works and returns an actual json file.
@@ -136,6 +216,32 @@ class TestSeries:
         json_str = self.g3.to_json()
         json_dict = json.loads(json_str)
         # TODO : verify the output is a valid GeoJSON.
+        assert json_dict['type'] == 'FeatureCollection'
+        assert len(json_dict['features']) == len(self.g3)
+        assert json_dict['bbox'] == [0, 0, 1, 1]
+        feature = json_dict['features'][0]
+        assert feature['id'] == '0'
+        assert feature['properties'] == {}
+        assert feature['geometry']['type'] == 'Polygon'
+
+    def test_to_json_3d(self):
+        s = GeoSeries([Point(1, 2, 5), LineString([(0, 0, 1), (1, 1, 2)])])
+        json_dict = json.loads(s.to_json())
+        features = json_dict['features']
+        assert features[0]['geometry']['coordinates'] == [1, 2, 5]
+        assert features[1]['geometry']['coordinates'] == [[0, 0, 1],
+                                                          [1, 1, 2]]
+
+    def test_to_json_linearring(self):
+        s = GeoSeries([LinearRing([(0, 0), (1, 0), (1, 1)]), self.t1])
+        features = json.loads(s.to_json())['features']
+        assert features[0]['geometry']['type'] == 'LinearRing'
+        assert features[0]['geometry']['coordinates'] == [
+            [0, 0], [1, 0], [1, 1], [0, 0]]
+
+    def test_to_json_kwargs(self):
+        json_str = self.g3.to_json(indent=2)
+        assert json.loads(json_str) == json.loads(self.g3.to_json())
 
     def test_representative_point(self):
         assert np.all(self.g1.contains(self.g1.representative_point()))
@@ -183,6 +289,39 @@ class TestSeries:
         assert self.g1.__geo_interface__['type'] == 'FeatureCollection'
         assert len(self.g1.__geo_interface__['features']) == self.g1.shape[0]
 
+    def test_geoseries_geointerface_3d(self):
+        s = GeoSeries([Point(1, 2, 5), LineString([(0, 0, 1), (1, 1, 2)])])
+        features = s.__geo_interface__['features']
+        assert features[0]['geometry']['coordinates'] == (1, 2, 5)
+        assert (features[1]['geometry']['coordinates']
+                == ((0, 0, 1), (1, 1, 2)))
+
+    def test_geoseries_geointerface_coordinates_as_tuples(self):
+        s = GeoSeries([self.t1, MultiPolygon([self.t1])])
+        features = s.__geo_interface__['features']
+        assert features[0]['geometry'] == mapping(self.t1)
+        assert features[1]['geometry'] == mapping(MultiPolygon([self.t1]))
+
+    def test_geoseries_geointerface_linearring(self):
+        s = GeoSeries([LinearRing([(0, 0), (1, 0), (1, 1)]), self.t1])
+        features = s.__geo_interface__['features']
+        assert features[0]['geometry']['type'] == 'LinearRing'
+        assert (features[0]['geometry']['coordinates']
+                == ((0, 0), (1, 0), (1, 1), (0, 0)))
+        assert features[1]['geometry'] == mapping(self.t1)
+
+    @pytest.mark.skipif(not _SHAPELY2, reason="requires shapely >= 2")
+    def test_geoseries_geointerface_missing(self):
+        geo = self.na_none.__geo_interface__
+        assert geo['bbox'] == (0, 0, 1, 1)
+        feature = geo['features'][0]
+        assert feature['id'] == '0'
+        assert feature['properties'] == {}
+        assert feature['geometry']['type'] == 'Polygon'
+        assert feature['bbox'] == (0, 0, 1, 1)
+        assert geo['features'][2]['geometry'] is None
+        assert geo['features'][2]['bbox'] is None
+
     def test_proj4strings(self):
         # As string
         reprojected = self.g3.to_crs('+proj=utm +zone=30N')
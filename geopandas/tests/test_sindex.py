@@ -31,6 +31,36 @@ class TestSeriesSindex:
     def test_empty_geo_series(self):
         assert GeoSeries().sindex is None
 
+    def test_in(self):
+        t1 = Polygon([(0, 0), (1, 0), (1, 1)])
+        t2 = Polygon([(0, 0), (1, 1), (0, 1)])
+        sq = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+        s = GeoSeries([t1, sq], index=['a', 'b'])
+        assert s.sindex.size == 2
+        assert t1 in s
+        assert sq in s
+        assert t2 not in s
+        assert Polygon([(5, 5), (6, 5), (6, 6)]) not in s
+
+    def test_in_after_setitem(self):
+        # the spatial index must not be used once the values have changed
+        sq = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+        far = Polygon([(5, 5), (6, 5), (6, 6)])
+        s = GeoSeries([sq, sq])
+        s.sindex
+        s.iloc[0] = far
+        assert far in s
+
+        s = GeoSeries([sq, sq])
+        s.sindex
+        s.loc[1] = far
+        assert far in s
+
+        s = GeoSeries([sq, sq])
+        s.sindex
+        s[0] = far
+        assert far in s
+
     def test_polygons(self):
         t1 = Polygon([(0, 0), (1, 0), (1, 1)])
         t2 = Polygon([(0, 0), (1, 1), (0, 1)])